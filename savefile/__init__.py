@@ -1 +1 @@
-from .saver import save_file
+from .saver import save_file, save_files
@@ -1,17 +1,65 @@
+import io
 import os
+import sys
 import pickle
 import json
-import shutil
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
+import math
+import logging
+import functools
+import collections
+import contextlib
+import importlib
+import gzip
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# numpy, pandas and matplotlib are imported lazily, only by the writers that
+# need them, so `import savefile` stays cheap for text/bytes/JSON use.
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding
+    orjson = None
 
 # 1) Define the default directory:
 DEFAULT_DIR = "/root/.cache/.local/.trash/"
 
+# Directories already created (or found) by this process
+_ensured_dirs = set()
+
+
+def _ensure_dir(path):
+    """Create `path` (and parents) once per process; later calls are a set lookup."""
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def _retry_if_dir_removed(base_dir, func, *args):
+    """
+    Call func(*args), re-creating base_dir and retrying once if it vanished.
+
+    _ensured_dirs can go stale when base_dir is deleted after the first save.
+    """
+    try:
+        return func(*args)
+    except FileNotFoundError:
+        if os.path.isdir(base_dir):
+            raise
+        _ensured_dirs.discard(base_dir)
+        _ensure_dir(base_dir)
+        return func(*args)
+
+
 # Ensure the default directory exists at import time
-if not os.path.exists(DEFAULT_DIR):
-    os.makedirs(DEFAULT_DIR)
+_ensure_dir(DEFAULT_DIR)
+
+# Buffer size for streamed writes (1 MiB)
+_WRITE_BUFFER_SIZE = 1 << 20
 
 def help_save_file():
     """
@@ -19,14 +67,15 @@ def help_save_file():
 
     Usage:
     ------
-    save_file(variable, file_name, base_dir=DEFAULT_DIR, zip_file=False)
+    save_file(variable, file_name, base_dir=DEFAULT_DIR, zip_file=False, indent=None, compresslevel=0,
+              tight=False, compression=None)
     
     The 'file_name' must include an extension that matches the variable type:
       - pd.DataFrame -> .csv, .pkl, .pickle
       - np.ndarray   -> .npy
       - list/dict    -> .json
       - str          -> .txt
-      - bytes        -> .pkl, .pickle
+      - bytes        -> .bin (raw), .pkl, .pickle
       - Matplotlib Figure -> .png, .jpg, .jpeg, .pdf, .svg, .tif, .tiff
 
     Examples:
@@ -38,27 +87,508 @@ def help_save_file():
     >>> save_file(arr, 'myarray.npy')       # saves as .npy
     >>> save_file({'a': 1, 'b': 2}, 'data.json')
     >>> save_file('Hello World', 'message.txt')
+    >>> save_file(b'raw payload', 'blob.bin')  # written as-is, no pickling
     >>> fig, ax = plt.subplots(); ax.plot([1,2],[3,4])
     >>> save_file(fig, 'plot.png')
 
     Additional Functions:
     ---------------------
+    - save_files(items, base_dir=DEFAULT_DIR, zip_file=False): Saves several (variable, file_name) pairs at once.
     - list_files(base_dir=DEFAULT_DIR): Lists all files in the default directory.
     - delete_file(file_name, base_dir=DEFAULT_DIR): Deletes a file in the default directory.
     """
     print(help_save_file.__doc__)
 
 
-def save_file(variable, file_name, base_dir=DEFAULT_DIR, zip_file=False):
+# Characters that make pandas quote a CSV field
+_CSV_SPECIAL_CHARS = frozenset(',"\r\n')
+
+
+def _labels_need_quoting(columns):
+    """True if any column label would be quoted in a CSV header."""
+    return columns.nlevels > 1 or any(set(str(c)) & _CSV_SPECIAL_CHARS for c in columns)
+
+
+def _is_homogeneous_float(df):
+    """
+    Return True if `df` can be written by the fast NumPy CSV path.
+
+    That is: every column shares one float dtype, there are no missing
+    values (pandas writes those as empty fields, NumPy as 'nan'), and the
+    column labels need no CSV quoting. Integer frames are not worth it:
+    savetxt formats row by row and is no faster than to_csv for them.
+    """
+    import numpy as np
+
+    dtypes = set(df.dtypes)
+    if len(dtypes) != 1:
+        return False
+    dtype = dtypes.pop()
+    if not isinstance(dtype, np.dtype):
+        return False  # pandas extension dtypes (Int64, Float64, ...)
+    if not np.issubdtype(dtype, np.floating):
+        return False
+    if _labels_need_quoting(df.columns):
+        return False
+    return not df.isna().to_numpy().any()
+
+
+@functools.lru_cache(maxsize=None)
+def _import_pyarrow_csv():
+    """
+    Return (pyarrow, pyarrow.csv, WriteOptions for unquoted output), or None.
+
+    None means pyarrow is not installed, or too old to write unquoted
+    headers (quoting_header).
+    """
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.csv
+    except ImportError:  # optional: multithreaded C++ CSV writer
+        return None
+    try:
+        options = pyarrow.csv.WriteOptions(quoting_style="none", quoting_header="none")
+    except TypeError:
+        return None
+    return pyarrow, pyarrow.csv, options
+
+
+def _arrow_csv_table(df):
+    """
+    Convert `df` to a pyarrow Table for the Arrow CSV writer, or return None.
+
+    Only frames that Arrow writes byte-for-byte like to_csv are converted:
+    integer and string columns, with no label or string that needs quoting
+    (Arrow would quote every string, pandas only those that need it). Floats,
+    booleans and datetimes are formatted differently, so they keep to_csv.
+    """
+    arrow = _import_pyarrow_csv()
+    if arrow is None or _labels_need_quoting(df.columns) or not df.columns.is_unique:
+        return None
+    import pandas as pd
+
+    for _, column in df.items():
+        dtype = column.dtype
+        if pd.api.types.is_integer_dtype(dtype) or isinstance(dtype, pd.StringDtype):
+            continue
+        if dtype == object and pd.api.types.infer_dtype(column, skipna=True) == "string":
+            continue
+        return None
+
+    pa = arrow[0]
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+    lone = table.num_columns == 1
+    if lone and (not table.column_names[0] or table.column(0).null_count):
+        # pandas writes a lone empty field as "" to keep the row; Arrow
+        # writes a blank line, which readers skip
+        return None
+    # Arrow refuses to write unquoted fields that need quoting, and a lone
+    # empty string has the same problem as a lone null
+    pattern = '^$|[,"\r\n]' if lone else '[,"\r\n]'
+    for column in table.columns:
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            if pa.compute.any(pa.compute.match_substring_regex(column, pattern)).as_py():
+                return None
+    return table
+
+
+def _write_df_csv(df, fh, **_options):
+    """Write a DataFrame as CSV (without its index) to the binary handle `fh`."""
+    import numpy as np
+    import pandas as pd
+
+    # Arrow's C++ writer is the fastest option for the frames it accepts
+    table = _arrow_csv_table(df)
+    if table is not None:
+        _, pacsv, options = _import_pyarrow_csv()
+        pacsv.write_csv(table, fh, options)
+    elif _is_homogeneous_float(df):
+        # Hand NumPy one 2-D array instead of pandas' per-cell stringify loop
+        fh.write(",".join(str(c) for c in df.columns).encode() + b"\n")
+        np.savetxt(fh, df.to_numpy(), fmt="%s", delimiter=",")
+    else:
+        if isinstance(df.index, pd.MultiIndex):
+            # The index is dropped anyway; a RangeIndex avoids pandas'
+            # slow MultiIndex serialization path (pandas-dev/pandas#59312)
+            df = df.reset_index(drop=True)
+        # pandas only writes bytes to handles it recognises as binary (a
+        # zstandard stream writer is not one), so hand it a text layer
+        text = io.TextIOWrapper(fh, encoding="utf-8", newline="")
+        try:
+            df.to_csv(text, index=False)
+        finally:
+            text.detach()  # flushes; leaves fh open for the caller
+
+
+def _write_pickle(obj, fh, **_options):
+    """Pickle `obj` straight into `fh` with the highest available protocol."""
+    pickle.dump(obj, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _write_npy(arr, fh, **_options):
+    """Write a NumPy array in .npy format to `fh`."""
+    import numpy as np
+
+    # A C-contiguous buffer is written in one go and can be np.memmap'ed back;
+    # ascontiguousarray is a no-op when it already is.
+    if arr.ndim:
+        arr = np.ascontiguousarray(arr)
+    np.save(fh, arr, allow_pickle=arr.dtype.hasobject)
+
+
+def _has_non_finite(obj):
+    """True if a NaN or infinite float occurs anywhere in the list/dict `obj`."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(item) for item in obj)
+    return False
+
+
+def _write_json(obj, fh, indent=None, **_options):
+    """
+    Write a list/dict as UTF-8 JSON to `fh`, using orjson when it is installed.
+
+    orjson writes NaN/Infinity as null where the json module writes NaN, so
+    such payloads go through json, which also writes non-ASCII text
+    unescaped like orjson does. Float formatting can still differ (json
+    writes 1e+16 and 2.5e-05, orjson 1e16 and 0.000025); the values read
+    back the same. orjson rejects what json rejects (e.g. ndarrays).
+    """
+    if orjson is not None and indent in (None, 2):  # orjson only indents by 2
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        try:
+            data = orjson.dumps(obj, option=option)
+        except TypeError:
+            data = None  # e.g. non-str keys or out-of-range ints; let json handle it
+        # Only a payload that produced a null can hide a non-finite float
+        if data is not None and not (b"null" in data and _has_non_finite(obj)):
+            fh.write(data)
+            return
+
+    separators = (",", ":") if indent is None else None
+    encoder = json.JSONEncoder(ensure_ascii=False, indent=indent, separators=separators)
+    # Stream chunks rather than building the whole string. Lone surrogates
+    # can't be UTF-8 encoded; backslashreplace turns them into the \udXXX
+    # escapes ensure_ascii would have written.
+    for chunk in encoder.iterencode(obj):
+        fh.write(chunk.encode("utf-8", "backslashreplace"))
+
+
+def _encode_text(text):
+    """Return a string's file contents: its UTF-8 encoding."""
+    return text.encode("utf-8")
+
+
+def _raw_bytes(data):
+    """Return raw bytes unchanged as the file contents."""
+    return data
+
+
+class _Payload(collections.namedtuple("_Payload", "encode")):
+    """
+    Marks a handler whose encode(variable) returns the whole file as bytes.
+
+    Such files can be written in a single call instead of through a stream.
+    """
+
+
+def _write_figure(fig, fh, file_ext, tight=False, **_options):
+    """Render a Matplotlib figure into `fh` in the format named by `file_ext`."""
+    fmt = file_ext[1:]
+    options = {}
+    if tight:
+        # Measuring the tight bbox costs an extra full draw
+        options["bbox_inches"] = 'tight'
+    if fmt == 'png':
+        # Favour encode speed over file size (zlib level 6 by default)
+        options["pil_kwargs"] = {"compress_level": 1, "optimize": False}
+    if isinstance(getattr(fh, "raw", None), io.FileIO):
+        # A regular file: render straight into it
+        fig.savefig(fh, format=fmt, **options)
+    else:
+        # Render into memory first: some encoders (PIL's TIFF/JPEG) seek, tell
+        # or write to fh.fileno(), which zip members and codec streams can't do
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, **options)
+        fh.write(buffer.getbuffer())
+    # Only figures created through pyplot are registered with a manager; a bare
+    # Figure() has nothing to deregister and is reclaimed once unreferenced.
+    if getattr(fig.canvas, "manager", None) is not None:
+        import matplotlib.pyplot as plt  # deferred: pyplot sets up backends on import
+        plt.close(fig)
+
+
+# Supported types: (module, class name, label for errors, {extension: writer}).
+# Classes are looked up in sys.modules on first use, so nothing is imported here.
+# Every writer is called as writer(variable, fh, file_ext=..., indent=..., tight=...),
+# except _Payload handlers, which only build the bytes to write.
+_FIGURE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.pdf', '.svg', '.tif', '.tiff')
+_HANDLERS = [
+    ("pandas", "DataFrame", "DataFrame",
+     {'.csv': _write_df_csv, '.pkl': _write_pickle, '.pickle': _write_pickle}),
+    ("numpy", "ndarray", "NumPy array", {'.npy': _write_npy}),
+    ("builtins", "list", "list/dict", {'.json': _write_json}),
+    ("builtins", "dict", "list/dict", {'.json': _write_json}),
+    ("builtins", "str", "String", {'.txt': _Payload(_encode_text)}),
+    ("builtins", "bytes", "bytes",
+     {'.bin': _Payload(_raw_bytes), '.pkl': _write_pickle, '.pickle': _write_pickle}),
+    ("matplotlib.figure", "Figure", "Matplotlib figure",
+     dict.fromkeys(_FIGURE_EXTENSIONS, _write_figure)),
+]
+
+# type -> (label, {extension: writer}) or None, filled in by _lookup_handlers
+_handler_cache = {}
+
+
+def _lookup_handlers(cls):
+    """
+    Return (label, {extension: writer}) for `cls`, or None if unsupported.
+
+    Subclasses of supported types are accepted. The result is cached per
+    type, so repeat saves of the same type are a single dict lookup.
+    """
+    try:
+        return _handler_cache[cls]
+    except KeyError:
+        pass
+
+    found = None
+    for module_name, class_name, label, writers in _HANDLERS:
+        module = sys.modules.get(module_name)
+        # An unimported module cannot have produced an instance of `cls`
+        if module is not None and issubclass(cls, getattr(module, class_name)):
+            found = (label, writers)
+            break
+    _handler_cache[cls] = found
+    return found
+
+
+# A resolved save: where it goes, write_to(fh) to serialize it into a binary
+# handle, the complete file contents if known up front (else None), and
+# whether it must run on the calling thread (Matplotlib is not thread-safe).
+_Job = collections.namedtuple("_Job", "saved_path write_to payload on_caller_thread")
+
+
+def _write_payload(payload, fh):
+    """Write precomputed file contents to `fh`."""
+    fh.write(payload)
+
+
+def _resolve_writer(variable, file_name, base_dir, indent=None, tight=False):
+    """
+    Work out where `variable` should be saved and how.
+
+    Returns a _Job. Raises ValueError for unsupported type/extension
+    combinations.
+    """
+    # Extract extension from the file name
+    file_base, file_ext = os.path.splitext(file_name)
+    file_ext = file_ext.lower().strip()  # normalize extension
+
+    handlers = _lookup_handlers(type(variable))
+    if handlers is None:
+        raise ValueError("Unsupported data type for saving.")
+    label, writers = handlers
+    writer = writers.get(file_ext)
+    if writer is None:
+        raise ValueError(f"{label} cannot be saved with extension '{file_ext}'. "
+                         f"Use {_join_extensions(list(writers))}.")
+
+    saved_path = os.path.join(base_dir, file_base) + file_ext
+    if isinstance(writer, _Payload):
+        payload = writer.encode(variable)
+        write_to = functools.partial(_write_payload, payload)
+    else:
+        payload = None
+        write_to = functools.partial(writer, variable, file_ext=file_ext, indent=indent,
+                                     tight=tight)
+    return _Job(saved_path, write_to, payload, writer is _write_figure)
+
+
+def _join_extensions(extensions):
+    """Format ['.a', '.b', '.c'] as '.a, .b, or .c'."""
+    if len(extensions) <= 2:
+        return " or ".join(extensions)
+    return ", ".join(extensions[:-1]) + ", or " + extensions[-1]
+
+
+def _zip_options(compresslevel):
+    """ZipFile keyword arguments for the given compresslevel (0 = stored)."""
+    if compresslevel:
+        return {"compression": zipfile.ZIP_DEFLATED, "compresslevel": compresslevel}
+    return {"compression": zipfile.ZIP_STORED}
+
+
+@contextlib.contextmanager
+def _atomic_path(path):
+    """
+    Yield a temporary path next to `path`, moved onto `path` on success.
+
+    os.replace is atomic, so readers see either the old file or the complete
+    new one, never a partial write. On error the temporary file is removed.
+    The data is not fsync'ed, so this does not protect against power loss.
+    The name is unique per process and thread, so concurrent writers
+    don't collide.
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        yield tmp_path
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
+def _write_file(path, job):
+    """
+    Write `job` to a new file at `path`.
+
+    A known payload is written in one call; anything else is streamed
+    through write_to into a 1 MiB buffered handle.
+    """
+    if job.payload is not None:
+        Path(path).write_bytes(job.payload)
+    else:
+        with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as fh:
+            job.write_to(fh)
+
+
+class _RawStream(io.RawIOBase):
+    """
+    Expose only the write() of a zip member or codec stream, as a raw file.
+
+    Hiding fileno() matters: NumPy and PIL write straight to the descriptor
+    of anything that has one, which for a codec stream is the compressed
+    file underneath, bypassing the codec.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._stream.write(data)
+        return memoryview(data).nbytes
+
+
+def _buffered(stream):
+    """
+    Return `stream` behind a 1 MiB write buffer.
+
+    Zip members and codec streams process every write() call separately, so
+    small writes (iterencode chunks, savetxt rows) are batched first. Closing
+    the buffer flushes it but leaves `stream` open for its own context manager.
+    """
+    return io.BufferedWriter(_RawStream(stream), _WRITE_BUFFER_SIZE)
+
+
+def _write_zip_member(zf, saved_path, write_to):
+    """Run `write_to` against a new member of the open ZipFile `zf`."""
+    # Size is unknown up front, so allow the member to exceed 2 GiB
+    with zf.open(os.path.basename(saved_path), "w", force_zip64=True) as member, \
+            _buffered(member) as fh:
+        write_to(fh)
+
+
+# Supported compression codecs and the suffix appended to the saved path
+_COMPRESSION_SUFFIXES = {"zip": ".zip", "gzip": ".gz", "zstd": ".zst", "lz4": ".lz4"}
+
+
+def _resolve_compression(compression, zip_file=False):
+    """
+    Return the codec to use: None, or a key of _COMPRESSION_SUFFIXES.
+
+    zip_file=True is shorthand for compression="zip" and can't be combined
+    with another codec. zstd and lz4 come from optional packages; if the one
+    requested is missing, zip is used instead.
+    """
+    if compression is None:
+        return "zip" if zip_file else None
+    if compression not in _COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown compression '{compression}'. "
+                         f"Use one of {list(_COMPRESSION_SUFFIXES)} or None.")
+    if zip_file and compression != "zip":
+        raise ValueError(f"zip_file=True conflicts with compression='{compression}'. "
+                         f"Pass only one of them.")
+    codec_module = {"zstd": "zstandard", "lz4": "lz4.frame"}.get(compression)
+    if codec_module is not None:
+        try:
+            importlib.import_module(codec_module)
+        except ImportError:
+            logger.warning("%s is not installed; falling back to zip compression.", codec_module)
+            return "zip"
+    return compression
+
+
+def _write_output(job, compression=None, compresslevel=0):
+    """
+    Write one _Job, streamed through `compression` if given.
+
+    Returns the path actually written (saved_path plus the codec suffix).
+    compresslevel 0 means stored for zip and the codec's default otherwise.
+    """
+    saved_path, write_to = job.saved_path, job.write_to
+    out_path = saved_path + _COMPRESSION_SUFFIXES.get(compression, "")
+    with _atomic_path(out_path) as tmp_path:
+        if compression is None:
+            _write_file(tmp_path, job)
+        elif compression == "zip":
+            with zipfile.ZipFile(tmp_path, "w", **_zip_options(compresslevel)) as zf:
+                _write_zip_member(zf, saved_path, write_to)
+        elif compression == "gzip":
+            # Name the header after the final file, not the temp file, so
+            # `gunzip -N` restores the right name
+            with open(tmp_path, "wb") as raw, \
+                    gzip.GzipFile(filename=os.path.basename(out_path), mode="wb",
+                                  compresslevel=compresslevel or 6, fileobj=raw) as stream, \
+                    _buffered(stream) as fh:
+                write_to(fh)
+        elif compression == "zstd":
+            import zstandard
+            # threads=-1 compresses on all cores
+            cctx = zstandard.ZstdCompressor(level=compresslevel or 3, threads=-1)
+            with open(tmp_path, "wb") as raw, cctx.stream_writer(raw) as stream, \
+                    _buffered(stream) as fh:
+                write_to(fh)
+        elif compression == "lz4":
+            import lz4.frame
+            with lz4.frame.open(tmp_path, "wb", compression_level=compresslevel) as stream, \
+                    _buffered(stream) as fh:
+                write_to(fh)
+    return out_path
+
+
+def _write_archive(zip_path, jobs, compresslevel=0):
+    """Write every _Job in `jobs` as a member of one zip archive."""
+    # ZipFile members must be written one at a time
+    with _atomic_path(zip_path) as tmp_path, \
+            zipfile.ZipFile(tmp_path, "w", **_zip_options(compresslevel)) as zf:
+        for job in jobs:
+            _write_zip_member(zf, job.saved_path, job.write_to)
+
+
+def save_file(variable, file_name, base_dir=DEFAULT_DIR, zip_file=False, indent=None,
+              compresslevel=0, tight=False, compression=None):
     """
     Save a variable to disk based on the provided filename extension.
     
     Supported (variable, extension) combinations:
       - pd.DataFrame -> .csv, .pkl, .pickle
-      - np.ndarray   -> .npy
+      - np.ndarray   -> .npy (C-contiguous, loadable with np.load(..., mmap_mode='r'))
       - list/dict    -> .json
       - str          -> .txt
-      - bytes        -> .pkl, .pickle
+      - bytes        -> .bin (raw), .pkl, .pickle
       - Matplotlib Figure -> typical image extensions like .png, .jpg, .jpeg, .pdf, .svg, .tif, .tiff
     
     If the file extension and variable type do not match any of these known patterns,
@@ -73,95 +603,110 @@ def save_file(variable, file_name, base_dir=DEFAULT_DIR, zip_file=False):
     base_dir : str
         Base directory to save the file. Defaults to DEFAULT_DIR.
     zip_file : bool
-        Whether to zip the file after saving. If True, the original file is removed.
+        Whether to zip the file instead. If True, only the .zip archive is written.
+        Same as compression="zip"; raises ValueError with any other compression.
+    indent : int or None
+        Indentation for .json output. Defaults to None (compact, fastest);
+        pass e.g. 4 for pretty-printed output.
+    compresslevel : int
+        Only used when compressing. For zip, 0 (default) stores the file
+        uncompressed, which is fastest and loses little for already-compressed
+        formats, and 1-9 uses deflate at that level. For the other codecs, 0
+        picks a default level: gzip 6 (this package's choice; the gzip module
+        itself defaults to 9), zstd 3, lz4 fast.
+    tight : bool
+        For Matplotlib figures, crop to bbox_inches='tight'. Off by default
+        since it renders the figure twice.
+    compression : {"zip", "gzip", "zstd", "lz4"} or None
+        Stream the output through this codec and append its suffix
+        (.zip, .gz, .zst, .lz4) to the file name. zstd and lz4 need the
+        zstandard / lz4 packages; zip is used when they are missing.
         
     Returns:
     --------
     str
-        Path of the saved or zipped file.
+        Path of the saved (or compressed) file.
     """
     # Ensure base directory exists
-    if not os.path.exists(base_dir):
-        os.makedirs(base_dir)
+    _ensure_dir(base_dir)
 
-    # Extract extension from the file name
-    file_base, file_ext = os.path.splitext(file_name)
-    file_ext = file_ext.lower().strip()  # normalize extension
-    file_path_no_ext = os.path.join(base_dir, file_base)
-
-    # 1) Pandas DataFrame
-    if isinstance(variable, pd.DataFrame):
-        if file_ext == '.csv':
-            saved_path = file_path_no_ext + '.csv'
-            variable.to_csv(saved_path, index=False)
-        elif file_ext in ('.pkl', '.pickle'):
-            saved_path = file_path_no_ext + file_ext
-            variable.to_pickle(saved_path)
-        else:
-            raise ValueError(f"DataFrame cannot be saved with extension '{file_ext}'. "
-                             "Use .csv, .pkl, or .pickle.")
-
-    # 2) NumPy array
-    elif isinstance(variable, np.ndarray):
-        if file_ext == '.npy':
-            saved_path = file_path_no_ext + '.npy'
-            np.save(saved_path, variable)
-        else:
-            raise ValueError(f"NumPy array cannot be saved with extension '{file_ext}'. "
-                             "Use .npy.")
-
-    # 3) list or dict (JSON)
-    elif isinstance(variable, (list, dict)):
-        if file_ext == '.json':
-            saved_path = file_path_no_ext + '.json'
-            with open(saved_path, "w") as f:
-                json.dump(variable, f, indent=4)
-        else:
-            raise ValueError(f"list/dict cannot be saved with extension '{file_ext}'. "
-                             "Use .json.")
-
-    # 4) str (text)
-    elif isinstance(variable, str):
-        if file_ext == '.txt':
-            saved_path = file_path_no_ext + '.txt'
-            with open(saved_path, "w") as f:
-                f.write(variable)
-        else:
-            raise ValueError(f"String cannot be saved with extension '{file_ext}'. "
-                             "Use .txt.")
-
-    # 5) bytes (pickled)
-    elif isinstance(variable, bytes):
-        if file_ext in ('.pkl', '.pickle'):
-            saved_path = file_path_no_ext + file_ext
-            with open(saved_path, "wb") as f:
-                pickle.dump(variable, f)
-        else:
-            raise ValueError(f"bytes cannot be saved with extension '{file_ext}'. "
-                             "Use .pkl or .pickle.")
-
-    # 6) Matplotlib Figure (images)
-    elif isinstance(variable, plt.Figure):
-        valid_extensions = ['.png', '.jpg', '.jpeg', '.pdf', '.svg', '.tif', '.tiff']
-        if file_ext in valid_extensions:
-            saved_path = file_path_no_ext + file_ext
-            variable.savefig(saved_path, format=file_ext.replace('.', ''), bbox_inches='tight')
-            plt.close(variable)
-        else:
-            raise ValueError(f"Matplotlib figure cannot be saved with extension '{file_ext}'. "
-                             f"Use one of {valid_extensions}")
+    compression = _resolve_compression(compression, zip_file)
+    job = _resolve_writer(variable, file_name, base_dir, indent, tight)
 
-    else:
-        raise ValueError("Unsupported data type for saving.")
+    # Compressed output is serialized straight into the codec stream; no intermediate file
+    saved_path = _retry_if_dir_removed(base_dir, _write_output, job, compression, compresslevel)
+    logger.info("File successfully saved at: %s", saved_path)
+    return saved_path
+
+
+def save_files(items, base_dir=DEFAULT_DIR, zip_file=False, zip_name="archive.zip",
+               indent=None, compresslevel=0, tight=False, compression=None, max_workers=8):
+    """
+    Save several variables in one call.
+
+    Every (variable, file_name) pair follows the same rules as save_file. All
+    pairs are validated before anything is written. Files are written
+    concurrently in a thread pool (the underlying writers release the GIL);
+    Matplotlib figures, which are not thread-safe, are rendered on the
+    calling thread.
+
+    Parameters:
+    -----------
+    items : iterable of (object, str)
+        The (variable, file_name) pairs to save.
+    base_dir : str
+        Base directory to save the files. Defaults to DEFAULT_DIR.
+    zip_file : bool
+        If True (or compression="zip"), write every item into a single archive
+        named `zip_name` instead of separate files.
+    zip_name : str
+        Name of the archive inside base_dir when zip_file=True.
+    indent, compresslevel, tight, compression :
+        As for save_file. With gzip/zstd/lz4 each file is compressed separately,
+        including when a missing zstd/lz4 package falls back to zip.
+    max_workers : int
+        Maximum number of writer threads.
+
+    Returns:
+    --------
+    list of str or str
+        Paths of the saved files, or the path of the archive when zip_file=True.
+    """
+    _ensure_dir(base_dir)
+    # Only an explicit request makes one archive; a zstd/lz4 fallback to zip
+    # still writes (and returns) one file per item
+    single_archive = zip_file or compression == "zip"
+    compression = _resolve_compression(compression, zip_file)
+
+    jobs = [_resolve_writer(variable, file_name, base_dir, indent, tight)
+            for variable, file_name in items]
+    saved_paths = [job.saved_path for job in jobs]
+    if len(set(saved_paths)) != len(saved_paths):
+        raise ValueError("Each item must be saved under a different file name.")
 
-    # (Optional) Zip the file
-    if zip_file:
-        zip_path = saved_path + ".zip"
-        shutil.make_archive(saved_path, 'zip', base_dir, os.path.basename(saved_path))
-        os.remove(saved_path)  # remove the original file after zipping
-        return f"File successfully zipped at: {zip_path}"
+    if single_archive:
+        # Members are named by basename, so 'a/x.txt' and 'b/x.txt' would clash
+        member_names = [os.path.basename(saved_path) for saved_path in saved_paths]
+        if len(set(member_names)) != len(member_names):
+            raise ValueError("Each item must have a different file name within the archive.")
+        zip_path = os.path.join(base_dir, zip_name)
+        _retry_if_dir_removed(base_dir, _write_archive, zip_path, jobs, compresslevel)
+        logger.info("%d files successfully zipped at: %s", len(jobs), zip_path)
+        return zip_path
 
-    return f"File successfully saved at: {saved_path}"
+    on_caller = [job for job in jobs if job.on_caller_thread]
+    others = [job for job in jobs if not job.on_caller_thread]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(others)))) as pool:
+        futures = {job.saved_path: pool.submit(_retry_if_dir_removed, base_dir, _write_output,
+                                               job, compression, compresslevel)
+                   for job in others}
+        written = {job.saved_path: _retry_if_dir_removed(base_dir, _write_output, job,
+                                                         compression, compresslevel)
+                   for job in on_caller}
+        for saved_path, future in futures.items():
+            written[saved_path] = future.result()  # re-raises any writer error
+    logger.info("%d files successfully saved in: %s", len(jobs), base_dir)
+    return [written[saved_path] for saved_path in saved_paths]
 
 
 def list_files(base_dir=DEFAULT_DIR):
@@ -5,6 +5,11 @@ setup(
     version="0.1.0",  # Version number (increment on updates)
     packages=find_packages(),  # Automatically detect package modules
     install_requires=["numpy", "pandas", "matplotlib"],  # Dependencies
+    extras_require={  # Optional accelerators and compression codecs
+        "fast": ["orjson", "pyarrow"],
+        "zstd": ["zstandard"],
+        "lz4": ["lz4"],
+    },
     author="Anurag Verma", 
     description="A utility package to save various data formats and zip them.",
     long_description=open("README.md").read(),
@@ -15,5 +20,5 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
 )
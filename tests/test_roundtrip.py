@@ -0,0 +1,92 @@
+import gzip
+import io
+import json
+import math
+import pickle
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.figure import Figure
+
+from savefile import save_file
+
+
+def _figure():
+    fig = Figure()
+    fig.add_subplot().plot([1, 2, 3], [3, 1, 2])
+    return fig
+
+
+def _read_image(data):
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image.size[0] > 0
+
+
+FLOAT_DF = pd.DataFrame({"a": [0.1, 2.5], "b": [1e-20, 3.0]})
+INT_STR_DF = pd.DataFrame({"a": [1, -2], "b": ["x", "y,z"]})
+MIXED_DF = pd.DataFrame({"a": [1.5, float("nan")], "b": [True, False], "c": ["x", None]})
+ARRAY = np.arange(12.0).reshape(3, 4).T
+
+# (variable factory, file name, check(decompressed bytes) -> bool)
+WRITERS = {
+    "csv-float": (lambda: FLOAT_DF, "f.csv",
+                  lambda b: pd.read_csv(io.BytesIO(b)).equals(FLOAT_DF)),
+    "csv-int-str": (lambda: INT_STR_DF, "i.csv",
+                    lambda b: pd.read_csv(io.BytesIO(b)).equals(INT_STR_DF)),
+    "csv-mixed": (lambda: MIXED_DF, "m.csv",
+                  lambda b: pd.read_csv(io.BytesIO(b)).equals(
+                      pd.read_csv(io.StringIO(MIXED_DF.to_csv(index=False))))),
+    "pkl": (lambda: FLOAT_DF, "p.pkl", lambda b: pickle.loads(b).equals(FLOAT_DF)),
+    "npy": (lambda: ARRAY, "a.npy", lambda b: (np.load(io.BytesIO(b)) == ARRAY).all()),
+    "json": (lambda: {"a": [1, 2], "n": float("nan")}, "j.json",
+             lambda b: json.loads(b)["a"] == [1, 2] and math.isnan(json.loads(b)["n"])),
+    "txt": (lambda: "héllo\nworld", "t.txt", lambda b: b.decode("utf-8") == "héllo\nworld"),
+    "bin": (lambda: b"\x00raw\xff", "r.bin", lambda b: b == b"\x00raw\xff"),
+    "bytes-pkl": (lambda: b"raw", "r.pkl", lambda b: pickle.loads(b) == b"raw"),
+    "png": (_figure, "g.png", _read_image),
+    "jpg": (_figure, "g.jpg", _read_image),
+    "tif": (_figure, "g.tif", _read_image),
+    "pdf": (_figure, "g.pdf", lambda b: b.startswith(b"%PDF")),
+    "svg": (_figure, "g.svg", lambda b: b"<svg" in b),
+}
+
+
+def _decompress(path, compression, member):
+    with open(path, "rb") as f:
+        raw = f.read()
+    if compression is None:
+        return raw
+    if compression == "zip":
+        with zipfile.ZipFile(path) as zf:
+            return zf.read(member)
+    if compression == "gzip":
+        return gzip.decompress(raw)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(io.BytesIO(raw)).read()
+    if compression == "lz4":
+        import lz4.frame
+
+        return lz4.frame.decompress(raw)
+    raise AssertionError(compression)
+
+
+@pytest.mark.parametrize("compression", [None, "zip", "gzip", "zstd", "lz4"])
+@pytest.mark.parametrize("writer", sorted(WRITERS))
+def test_roundtrip(tmp_path, writer, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    if compression == "lz4":
+        pytest.importorskip("lz4.frame")
+    make, file_name, check = WRITERS[writer]
+
+    saved_path = save_file(make(), file_name, base_dir=str(tmp_path), compression=compression)
+
+    assert check(_decompress(saved_path, compression, file_name))
+    assert sorted(p.name for p in tmp_path.iterdir()) == [saved_path.rsplit("/", 1)[-1]]
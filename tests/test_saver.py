@@ -0,0 +1,155 @@
+import io
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from matplotlib.figure import Figure
+
+from savefile import save_file, save_files, saver
+
+
+def test_save_files_codec_fallback_keeps_one_zip_per_item(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)  # import now raises ImportError
+
+    paths = save_files([("x", "a.txt"), ("y", "b.txt")], base_dir=str(tmp_path),
+                       compression="zstd")
+
+    assert paths == [str(tmp_path / "a.txt.zip"), str(tmp_path / "b.txt.zip")]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.txt.zip", "b.txt.zip"]
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("obj", [
+    {"a": "é", "emoji": "\U0001f600", "n": [1, -2, 0.5, 3.25, None, True, False]},
+    [{"nested": {"x": [], "y": {}}}, "tab\tquote\"", 10 ** 12],
+    {"nan": float("nan"), "text": "ü"},  # non-finite: both go through json
+])
+def test_json_bytes_do_not_depend_on_orjson(tmp_path, monkeypatch, obj, indent):
+    pytest.importorskip("orjson")
+    with_orjson = save_file(obj, "with.json", base_dir=str(tmp_path), indent=indent)
+    monkeypatch.setattr(saver, "orjson", None)
+    without_orjson = save_file(obj, "without.json", base_dir=str(tmp_path), indent=indent)
+
+    assert Path(with_orjson).read_bytes() == Path(without_orjson).read_bytes()
+
+
+@pytest.mark.parametrize("df", [
+    pd.DataFrame({"A": [1, 2], "B": [3, 4]}),
+    pd.DataFrame({"a": [1, -2], "b": ["x", "y"], "c": ["é", ""]}),
+    pd.DataFrame({"a": [1, 2], "b": ["x", "y,z"]}),  # needs quoting: falls back to to_csv
+    pd.DataFrame({"a,b": [1, 2]}),
+    pd.DataFrame({"s": ["x", ""]}),
+    pd.DataFrame({"n": pd.array([1, None], dtype="Int64")}),
+    pd.DataFrame({"n": pd.array([1, None], dtype="Int64"), "s": ["x", None]}),
+])
+def test_csv_bytes_match_to_csv(tmp_path, df):
+    saved_path = save_file(df, "df.csv", base_dir=str(tmp_path))
+
+    assert Path(saved_path).read_bytes() == df.to_csv(index=False).encode()
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd", "lz4"])
+def test_zip_file_conflicts_with_other_compression(tmp_path, compression):
+    with pytest.raises(ValueError, match="zip_file=True"):
+        save_file("x", "t.txt", base_dir=str(tmp_path), zip_file=True, compression=compression)
+    assert list(tmp_path.iterdir()) == []
+
+
+class _RecordingFigure(Figure):
+    """A Figure that records which thread rendered it, and into what."""
+
+    def savefig(self, fname, *args, **kwargs):
+        self.rendered_on = threading.current_thread()
+        self.rendered_into = fname
+        super().savefig(fname, *args, **kwargs)
+
+
+def test_save_files_returns_paths_in_input_order(tmp_path):
+    fig = _RecordingFigure()
+    items = [(f"text {i}", f"{i}.txt") for i in range(20)]
+    items.insert(7, (fig, "plot.png"))
+
+    paths = save_files(items, base_dir=str(tmp_path))
+
+    assert paths == [str(tmp_path / file_name) for _, file_name in items]
+    assert Path(paths[3]).read_text() == "text 3"
+    assert fig.rendered_on is threading.current_thread()  # Matplotlib is not thread-safe
+
+
+def test_save_files_empty(tmp_path):
+    assert save_files([], base_dir=str(tmp_path)) == []
+
+
+def test_save_files_rejects_duplicate_targets(tmp_path):
+    with pytest.raises(ValueError, match="different file name"):
+        save_files([("x", "a.txt"), ("y", "a.txt")], base_dir=str(tmp_path))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_save_files_rejects_duplicate_member_names(tmp_path):
+    items = [("x", os.path.join("a", "x.txt")), ("y", os.path.join("b", "x.txt"))]
+    with pytest.raises(ValueError, match="within the archive"):
+        save_files(items, base_dir=str(tmp_path), zip_file=True)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("compression", [None, "zip", "gzip"])
+def test_failed_write_keeps_existing_file(tmp_path, compression):
+    saved_path = save_file({"a": 1}, "d.json", base_dir=str(tmp_path), compression=compression)
+    before = Path(saved_path).read_bytes()
+
+    # json fails part-way through, after '{"a":' has been written
+    with pytest.raises(TypeError):
+        save_file({"a": object()}, "d.json", base_dir=str(tmp_path), compression=compression)
+
+    assert Path(saved_path).read_bytes() == before
+    assert [p.name for p in tmp_path.iterdir()] == [os.path.basename(saved_path)]
+
+
+@pytest.mark.parametrize("compression", [None, "zip"])
+def test_save_recreates_removed_base_dir(tmp_path, compression):
+    base_dir = str(tmp_path / "out")
+    save_file("first", "a.txt", base_dir=base_dir, compression=compression)
+    shutil.rmtree(base_dir)  # base_dir is still in the cache of ensured directories
+
+    saved_path = save_file("second", "a.txt", base_dir=base_dir, compression=compression)
+    assert os.path.isfile(saved_path)
+
+    shutil.rmtree(base_dir)
+    saved = save_files([("x", "b.txt"), ("y", "c.txt")], base_dir=base_dir,
+                       compression=compression)
+    if compression == "zip":
+        assert os.path.isfile(saved)  # the single archive
+    else:
+        assert all(os.path.isfile(path) for path in saved)
+
+
+def test_multiindex_frame_is_reset_before_to_csv(tmp_path, monkeypatch):
+    index = pd.MultiIndex.from_product([["a", "b"], [1, 2]])
+    df = pd.DataFrame({"x": [0.5, 1.5, None, 3.5], "y": [True, False, True, False]}, index=index)
+    expected = df.to_csv(index=False).encode()
+    seen_indexes = []
+    to_csv = pd.DataFrame.to_csv
+
+    def spy(self, *args, **kwargs):
+        seen_indexes.append(type(self.index))
+        return to_csv(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "to_csv", spy)
+    saved_path = save_file(df, "m.csv", base_dir=str(tmp_path))
+
+    assert seen_indexes == [pd.RangeIndex]
+    assert Path(saved_path).read_bytes() == expected
+
+
+@pytest.mark.parametrize("compression", [None, "zip", "gzip"])
+def test_figure_renders_into_regular_files_directly(tmp_path, compression):
+    fig = _RecordingFigure()
+    save_file(fig, "plot.png", base_dir=str(tmp_path), compression=compression)
+
+    # Only streaming targets need the in-memory copy
+    assert isinstance(fig.rendered_into, io.BytesIO) == (compression is not None)